@@ -1,4 +1,7 @@
 #!/usr/bin/env python
+import contextlib
+import os
+import tempfile
 from random import randint
 
 from pydantic import BaseModel
@@ -35,8 +38,19 @@ class PoemFlow(Flow[PoemState]):
     @listen(generate_poem)
     def save_poem(self):
         print("Saving poem")
-        with open("poem.txt", "w") as f:
-            f.write(self.state.poem)
+        # Write to a temp file and swap it in so readers never see a
+        # half-written poem.txt.
+        fd, tmp_path = tempfile.mkstemp(dir=".", prefix="poem.txt.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.state.poem)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, "poem.txt")
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
 
 
 def kickoff():